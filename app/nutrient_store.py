@@ -0,0 +1,555 @@
+import numpy as np
+import json
+import csv
+import os
+import re
+import shutil
+import time
+from typing import List, Dict, Optional, Iterable, Tuple
+
+# Nutrient columns kept in the store, keyed by FDC nutrient id.
+# FDC reports these per 100 g for Foundation, SR Legacy and search results.
+NUTRIENTS = {
+    1008: ("energy", "kcal"),
+    1003: ("protein", "g"),
+    1004: ("fat", "g"),
+    1005: ("carbohydrate", "g"),
+    1079: ("fiber", "g"),
+    2000: ("sugars", "g"),
+    1087: ("calcium", "mg"),
+    1089: ("iron", "mg"),
+    1090: ("magnesium", "mg"),
+    1092: ("potassium", "mg"),
+    1093: ("sodium", "mg"),
+    1095: ("zinc", "mg"),
+    1162: ("vitamin_c", "mg"),
+    1114: ("vitamin_d", "ug"),
+    1178: ("vitamin_b12", "ug"),
+    1177: ("folate", "ug"),
+    1253: ("cholesterol", "mg"),
+    1258: ("saturated_fat", "g"),
+}
+
+# Older FDC exports use legacy nutrient numbers instead of ids
+NUTRIENT_NUMBERS = {
+    "208": 1008, "203": 1003, "204": 1004, "205": 1005, "291": 1079,
+    "269": 2000, "301": 1087, "303": 1089, "304": 1090, "306": 1092,
+    "307": 1093, "309": 1095, "401": 1162, "328": 1114, "418": 1178,
+    "417": 1177, "601": 1253, "606": 1258,
+}
+
+# FDC CSV data types included by default; Branded foods add millions of rows
+DEFAULT_DATA_TYPES = ("foundation_food", "sr_legacy_food", "survey_fndds_food")
+
+# Allergen / diet tags, one bit each, matched as substrings of food names and
+# ingredients so compound words count ("cheesecake", "cornbread", "catfish").
+# Ambiguous words ("nut", "seafood") are listed under every tag they may mean.
+ALLERGENS = {
+    "milk": ["milk", "dairy", "cheese", "butter", "cream", "yogurt", "whey", "casein", "lactose",
+             "ghee", "kefir", "custard", "pizza", "eggnog", "latte", "mozzarella", "parmesan",
+             "ricotta", "paneer", "cheddar", "brie", "feta"],
+    "egg": ["egg", "albumin", "mayonnaise", "omelet", "meringue"],
+    "peanut": ["peanut", "nut"],
+    "tree_nut": ["almond", "walnut", "cashew", "pecan", "pistachio", "hazelnut", "macadamia",
+                 "brazil nut", "nut", "praline", "marzipan"],
+    "soy": ["soy", "tofu", "edamame", "tempeh", "miso"],
+    "wheat": ["wheat", "gluten", "barley", "rye", "flour", "bread", "pasta", "semolina", "couscous",
+              "noodle", "spaghetti", "macaroni", "cereal", "cracker", "bran", "bagel", "muffin",
+              "pancake", "waffle", "biscuit", "cookie", "cake", "pretzel", "bulgur", "spelt", "seitan",
+              "pizza", "dough", "tortilla", "croissant", "pastry", "pie crust", "dumpling"],
+    "fish": ["fish", "seafood", "salmon", "tuna", "cod", "trout", "sardine", "anchov", "mackerel",
+             "tilapia", "halibut", "herring", "pollock", "haddock", "snapper", "flounder", "sole",
+             "bass", "carp", "perch", "pike", "roe", "caviar", "surimi"],
+    "shellfish": ["shellfish", "seafood", "crustacean", "mollus", "shrimp", "prawn", "crab", "lobster",
+                  "crayfish", "crawfish", "clam", "mussel", "oyster", "scallop", "squid", "calamari",
+                  "octopus", "surimi"],
+    "sesame": ["sesame", "tahini"],
+    "meat": ["beef", "pork", "chicken", "turkey", "lamb", "veal", "ham", "bacon", "sausage", "duck",
+             "venison", "meat", "gelatin", "bison", "buffalo", "goat", "mutton", "rabbit", "elk",
+             "salami", "pepperoni", "prosciutto", "chorizo", "jerky", "frankfurter", "hot dog",
+             "bologna", "pastrami", "liver", "steak", "brisket", "poultry", "goose", "quail",
+             "lard", "broth", "bouillon"],
+}
+
+# Substrings removed before matching a tag, for words that only look like it
+ALLERGEN_EXCEPTIONS = {
+    "milk": ["peanut butter", "nut butter", "almond butter", "cashew butter", "apple butter",
+             "cocoa butter", "shea butter", "butternut", "buttercup", "butterbur", "cream of tartar",
+             "coconut milk", "coconut cream", "almond milk", "soy milk", "soymilk", "oat milk",
+             "rice milk", "cashew milk"],
+    "egg": ["eggplant", "veggie", "reggiano"],
+    "peanut": ["nutmeg", "butternut", "doughnut", "coconut", "water chestnut", "nutrition", "nutrient",
+               "nutri-", "minute"],
+    "tree_nut": ["nutmeg", "butternut", "doughnut", "water chestnut", "nutrition", "nutrient", "nutri-",
+                 "minute"],
+    "wheat": ["buckwheat", "breadfruit", "brand", "gluten-free", "gluten free"],
+    "meat": ["graham", "champagne", "chamomile", "lambsquarter", "meatless", "coconut meat", "nutmeat",
+             "chickpea", "collard", "liverwort", "goat cheese", "goat milk", "buffalo mozzarella",
+             "buffalo milk", "quail egg", "vegetable broth", "vegetable bouillon", "veggie broth",
+             "mushroom broth"],
+}
+
+# Tags implied by the FDC food category, whatever the food is called
+CATEGORY_ALLERGENS = {
+    "milk": r"dairy|cheese|milk|yogurt|ice cream",
+    "egg": r"\begg",
+    "tree_nut": r"\bnut",
+    "wheat": r"baked|bakery|bread|cereal|pasta|cookie|cracker|pizza",
+    "fish": r"fish|seafood",
+    "shellfish": r"shellfish|seafood",
+    "meat": r"beef|pork|lamb|veal|game|sausage|luncheon|poultry|meat",
+}
+
+ALLERGEN_BITS = {name: 1 << i for i, name in enumerate(ALLERGENS)}
+
+# Tags a vegetarian profile excludes on top of the listed allergies
+NON_VEGETARIAN = ("meat", "fish", "shellfish")
+
+# Nutrients worth quoting exact numbers for, by health condition pattern.
+# Patterns start at a word boundary; stems without a trailing \b match word prefixes.
+CONDITION_NUTRIENTS = {
+    r"diabet": ["fiber", "protein"],
+    r"t[12]d\b": ["fiber", "protein"],
+    r"hypertension\b": ["potassium", "magnesium"],
+    r"blood pressure\b": ["potassium", "magnesium"],
+    r"cholesterol\b": ["fiber"],
+    r"heart\b": ["fiber", "potassium"],
+    r"anae?mi": ["iron", "vitamin_c", "vitamin_b12"],
+    r"osteopor": ["calcium", "vitamin_d"],
+    r"bones?\b": ["calcium", "vitamin_d"],
+    r"pregnan": ["folate", "iron"],
+    r"constipation\b": ["fiber"],
+    r"muscles?\b": ["protein"],
+}
+
+# Used only when no health condition is given at all
+DEFAULT_NUTRIENTS = ["fiber", "protein"]
+
+_CONDITION_PATTERNS = {
+    re.compile(r"\b" + pattern, re.IGNORECASE): names
+    for pattern, names in CONDITION_NUTRIENTS.items()
+}
+
+# FDC food categories that are not meal foods (spices, supplements, leavening agents)
+NON_MEAL_CATEGORIES = re.compile(
+    r"spice|herb|supplement|leavening|baby food|infant formula", re.IGNORECASE
+)
+
+# Name fallback for records without a category (e.g. "Spices, cinnamon, ground")
+NON_MEAL_NAMES = re.compile(
+    r"\b(spices?|seasoning|powder|powdered|leavening|baking soda|yeast|extract|supplement|"
+    r"protein isolate|gum|gelatin|bouillon)\b",
+    re.IGNORECASE
+)
+
+# Free-text lists ("peanuts, dairy and eggs") are split into items on these
+_LIST_SEPARATORS = re.compile(r"[,;&\n]|\band\b", re.IGNORECASE)
+
+_NONE = re.compile(r"^\s*(none|no|nil|n/?a|nothing|no known( allergies)?)?\s*\.?\s*$", re.IGNORECASE)
+
+_ALLERGEN_PATTERNS = {
+    name: re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE)
+    for name, keywords in ALLERGENS.items()
+}
+
+_EXCEPTION_PATTERNS = {
+    name: re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE)
+    for name, keywords in ALLERGEN_EXCEPTIONS.items()
+}
+
+_CATEGORY_PATTERNS = {
+    name: re.compile(pattern, re.IGNORECASE) for name, pattern in CATEGORY_ALLERGENS.items()
+}
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def _tags(text: str) -> List[str]:
+    """Allergen tag names whose keywords appear in text, ignoring known look-alikes"""
+    tags = []
+    for name, pattern in _ALLERGEN_PATTERNS.items():
+        checked = text or ""
+        if name in _EXCEPTION_PATTERNS:
+            checked = _EXCEPTION_PATTERNS[name].sub(" ", checked)
+        if pattern.search(checked):
+            tags.append(name)
+    return tags
+
+
+def allergen_mask(text: str, category: str = "") -> int:
+    """Bitmask of allergen tags for a food name/ingredient list and its FDC category"""
+    mask = 0
+    for name in _tags(text):
+        mask |= ALLERGEN_BITS[name]
+    for name, pattern in _CATEGORY_PATTERNS.items():
+        if category and pattern.search(category):
+            mask |= ALLERGEN_BITS[name]
+    return mask
+
+
+def _items(text: str) -> List[str]:
+    """Non-empty items of a free-text list, ignoring 'none' / 'n/a' entries"""
+    items = [item.strip() for item in _LIST_SEPARATORS.split(text or "")]
+    return [item for item in items if item and not _NONE.match(item)]
+
+
+def is_meal_food(name: str, category: str = "") -> bool:
+    """Whether a food belongs in meal suggestions rather than being a spice or supplement"""
+    if category and NON_MEAL_CATEGORIES.search(category):
+        return False
+    return not NON_MEAL_NAMES.search(name)
+
+
+def parse_allergens(text: str) -> List[str]:
+    """Map free-text allergies (e.g. 'peanuts, dairy') to allergen tag names"""
+    return [name for name in _tags(text) if name != "meat"]
+
+
+def unmapped_allergies(text: str) -> List[str]:
+    """Listed allergies that map to no allergen tag (e.g. 'mustard'), so cannot be filtered"""
+    return [item for item in _items(text) if not parse_allergens(item)]
+
+
+def nutrients_for_conditions(text: str) -> List[str]:
+    """Nutrients relevant to free-text health conditions, in first-mentioned order.
+
+    Empty when any listed condition is unrecognised: generic advice such as
+    "highest protein" can harm e.g. kidney patients, so no facts are safer.
+    """
+    items = _items(text)
+    if not items:
+        return list(DEFAULT_NUTRIENTS)
+
+    nutrients = []
+    for item in items:
+        matched = False
+        for pattern, names in _CONDITION_PATTERNS.items():
+            if pattern.search(item):
+                matched = True
+                nutrients.extend(n for n in names if n not in nutrients)
+        if not matched:
+            return []
+    return nutrients
+
+
+def _food_nutrients(food: dict) -> Dict[int, float]:
+    """Extract {nutrient id: amount} from an FDC food record"""
+    values = {}
+    for item in food.get("foodNutrients", []):
+        # Search results are flat, bulk downloads nest the nutrient
+        nutrient = item.get("nutrient", {})
+        nutrient_id = item.get("nutrientId") or nutrient.get("id")
+        if nutrient_id is None:
+            number = item.get("nutrientNumber") or nutrient.get("number")
+            nutrient_id = NUTRIENT_NUMBERS.get(str(number))
+        amount = item.get("value", item.get("amount"))
+        if nutrient_id is None or amount is None:
+            continue
+        nutrient_id = int(nutrient_id)
+        if nutrient_id in NUTRIENTS:
+            values[nutrient_id] = float(amount)
+    return values
+
+
+def _food_category(food: dict) -> str:
+    """FDC food category description, flat in search results and nested in downloads"""
+    category = food.get("foodCategory") or food.get("brandedFoodCategory") or ""
+    if isinstance(category, dict):
+        category = category.get("description", "")
+    return category
+
+
+def _load_json_foods(path: str) -> Tuple[List[tuple], np.ndarray]:
+    """Foods from saved FDC search results or a JSON bulk download.
+
+    Returns (fdc_id, name, category, ingredients) records and their nutrient rows.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    if isinstance(data, list):
+        foods = data
+    else:
+        foods = []
+        for key in ("foods", "FoundationFoods", "SRLegacyFoods", "SurveyFoods", "BrandedFoods"):
+            foods.extend(data.get(key, []))
+
+    column = {nutrient_id: i for i, nutrient_id in enumerate(NUTRIENTS)}
+    records = []
+    values = np.full((len(foods), len(NUTRIENTS)), np.nan, dtype=np.float32)
+    for row, food in enumerate(foods):
+        records.append((
+            food.get("fdcId"),
+            (food.get("description") or "").strip(),
+            _food_category(food),
+            food.get("ingredients", ""),
+        ))
+        for nutrient_id, amount in _food_nutrients(food).items():
+            values[row, column[nutrient_id]] = amount
+    return records, values
+
+
+def _load_csv_foods(directory: str, data_types: Iterable[str]) -> Tuple[List[tuple], np.ndarray]:
+    """Foods from an FDC CSV export (food.csv + food_nutrient.csv).
+
+    food_nutrient.csv is streamed straight into a preallocated array, so memory
+    grows with the number of kept foods, not with the tens of millions of rows.
+    """
+    data_types = set(data_types)
+
+    categories = {}
+    category_path = os.path.join(directory, "food_category.csv")
+    if os.path.exists(category_path):
+        with open(category_path, encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                categories[row["id"]] = row.get("description", "")
+
+    records = []
+    rows = {}
+    with open(os.path.join(directory, "food.csv"), encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            if row.get("data_type") not in data_types:
+                continue
+            rows[row["fdc_id"]] = len(records)
+            records.append([
+                int(row["fdc_id"]),
+                (row.get("description") or "").strip(),
+                categories.get(row.get("food_category_id"), ""),
+                "",
+            ])
+
+    branded_path = os.path.join(directory, "branded_food.csv")
+    if "branded_food" in data_types and os.path.exists(branded_path):
+        with open(branded_path, encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                if row["fdc_id"] in rows:
+                    record = records[rows[row["fdc_id"]]]
+                    record[2] = row.get("branded_food_category") or record[2]
+                    record[3] = row.get("ingredients", "")
+
+    column = {str(nutrient_id): i for i, nutrient_id in enumerate(NUTRIENTS)}
+    values = np.full((len(records), len(NUTRIENTS)), np.nan, dtype=np.float32)
+    with open(os.path.join(directory, "food_nutrient.csv"), encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        fdc_col = header.index("fdc_id")
+        nutrient_col = header.index("nutrient_id")
+        amount_col = header.index("amount")
+        for row in reader:
+            i = column.get(row[nutrient_col])
+            if i is None or not row[amount_col]:
+                continue
+            food = rows.get(row[fdc_col])
+            if food is not None:
+                values[food, i] = float(row[amount_col])
+
+    return [tuple(record) for record in records], values
+
+
+def build_nutrient_store(sources: Iterable[str], persist_path="./nutrient_store",
+                         data_types: Iterable[str] = DEFAULT_DATA_TYPES):
+    """Build the columnar nutrient store from FDC fixtures or a local export.
+
+    Each build is written to a new version directory and swapped in by replacing
+    the CURRENT pointer, so a running server never sees half-written files.
+    """
+    records = []
+    blocks = []
+    seen = set()
+
+    for source in sources:
+        if os.path.isdir(source):
+            source_records, values = _load_csv_foods(source, data_types)
+        elif source.endswith(".json"):
+            source_records, values = _load_json_foods(source)
+        else:
+            continue
+
+        has_values = ~np.isnan(values).all(axis=1)
+        keep = []
+        for row, (fdc_id, name, category, ingredients) in enumerate(source_records):
+            if not name or not has_values[row] or (fdc_id is not None and fdc_id in seen):
+                continue
+            if fdc_id is not None:
+                seen.add(fdc_id)
+                fdc_id = int(fdc_id)
+            keep.append(row)
+            records.append((fdc_id, name, category, ingredients))
+        blocks.append(values[keep])
+
+    if not records:
+        raise ValueError("No FDC foods with nutrient data found!")
+
+    masks = [allergen_mask(f"{name} {ingredients}", category) for _, name, category, ingredients in records]
+    meal = [is_meal_food(name, category) for _, name, category, _ in records]
+
+    meta = {
+        "foods": [name for _, name, _, _ in records],
+        "fdc_ids": [fdc_id for fdc_id, _, _, _ in records],
+        "nutrients": [
+            {"id": nutrient_id, "name": NUTRIENTS[nutrient_id][0], "unit": NUTRIENTS[nutrient_id][1]}
+            for nutrient_id in NUTRIENTS
+        ],
+        "tagging": _tagging_rules(),
+    }
+
+    version = f"v{time.time_ns()}"
+    staging = os.path.join(persist_path, f".{version}.tmp")
+    os.makedirs(staging)
+    np.save(os.path.join(staging, "nutrients.npy"), np.vstack(blocks))
+    np.save(os.path.join(staging, "allergens.npy"), np.asarray(masks, dtype=np.uint16))
+    np.save(os.path.join(staging, "meal.npy"), np.asarray(meal, dtype=bool))
+    with open(os.path.join(staging, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(staging, os.path.join(persist_path, version))
+
+    pointer = os.path.join(persist_path, "CURRENT.tmp")
+    with open(pointer, "w", encoding="utf-8") as f:
+        f.write(version)
+    os.replace(pointer, os.path.join(persist_path, "CURRENT"))
+
+    # Servers still mapping an old version keep its files open until they reload
+    for entry in os.listdir(persist_path):
+        if entry != version and entry.startswith("v"):
+            shutil.rmtree(os.path.join(persist_path, entry), ignore_errors=True)
+
+
+def _tagging_rules() -> dict:
+    """Rules baked into stored allergen tags; a store built with other rules is stale"""
+    return {"keywords": ALLERGENS, "exceptions": ALLERGEN_EXCEPTIONS, "categories": CATEGORY_ALLERGENS}
+
+
+def nutrient_store_version(persist_path="./nutrient_store") -> Optional[str]:
+    """Version of the current nutrient store, or None if it has not been built"""
+    try:
+        with open(os.path.join(persist_path, "CURRENT"), encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+class NutrientStore:
+    def __init__(self, persist_path="./nutrient_store", version=None):
+        """Memory-map the current (or given) version of a store written by build_nutrient_store"""
+        self.version = version or nutrient_store_version(persist_path)
+        if self.version is None:
+            raise FileNotFoundError(f"No nutrient store found in {persist_path}")
+        path = os.path.join(persist_path, self.version)
+
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+
+        # Tags are computed at build time, so any rule change needs a rebuild
+        if meta.get("tagging") != _tagging_rules():
+            raise ValueError("Nutrient store allergen tags are out of date, rebuild it")
+
+        self.foods = meta["foods"]
+        # None where the FDC record had no id
+        self.fdc_ids = meta["fdc_ids"]
+        self.nutrients = [n["name"] for n in meta["nutrients"]]
+        self.units = {n["name"]: n["unit"] for n in meta["nutrients"]}
+        self.columns = {name: i for i, name in enumerate(self.nutrients)}
+
+        # Per 100 g, one row per food, NaN where FDC has no value
+        self.values = np.load(os.path.join(path, "nutrients.npy"), mmap_mode="r")
+        self.allergens = np.load(os.path.join(path, "allergens.npy"), mmap_mode="r")
+        # False for spices, supplements and other non-meal foods
+        self.meal = np.load(os.path.join(path, "meal.npy"), mmap_mode="r")
+
+        # Food-name index: exact lowercase name -> row, and name token -> rows
+        self.index = {}
+        self.tokens = {}
+        for row, name in enumerate(self.foods):
+            self.index.setdefault(name.lower(), row)
+            for token in set(_TOKEN.findall(name.lower())):
+                self.tokens.setdefault(token, []).append(row)
+
+    def __len__(self):
+        return len(self.foods)
+
+    def column(self, nutrient: str) -> int:
+        """Column number for a nutrient name, e.g. 'fiber'"""
+        if nutrient not in self.columns:
+            raise KeyError(f"Unknown nutrient '{nutrient}'. Available: {', '.join(self.nutrients)}")
+        return self.columns[nutrient]
+
+    def find(self, name: str) -> Optional[int]:
+        """Row of a food by exact name, else the shortest name containing every query word"""
+        key = (name or "").strip().lower()
+        if key in self.index:
+            return self.index[key]
+
+        # Whole-word match, so "egg" finds "Egg, whole, raw" but never "Eggplant, raw"
+        tokens = _TOKEN.findall(key)
+        if not tokens:
+            return None
+        rows = set(self.tokens.get(tokens[0], ()))
+        for token in tokens[1:]:
+            rows &= set(self.tokens.get(token, ()))
+        if not rows:
+            return None
+        return min(rows, key=lambda row: (len(self.foods[row]), row))
+
+    def lookup(self, name: str) -> Optional[Dict[str, float]]:
+        """All known nutrient values (per 100 g) for a food"""
+        row = self.find(name)
+        if row is None:
+            return None
+        values = self.values[row]
+        return {
+            nutrient: round(float(values[i]), 4)
+            for i, nutrient in enumerate(self.nutrients)
+            if not np.isnan(values[i])
+        }
+
+    def exclusion_mask(self, allergens: Iterable[str] = (), vegetarian=False) -> np.ndarray:
+        """Boolean mask of foods that contain none of the given allergen tags"""
+        tags = list(allergens)
+        if vegetarian:
+            tags.extend(NON_VEGETARIAN)
+
+        bits = 0
+        for tag in tags:
+            if tag not in ALLERGEN_BITS:
+                raise KeyError(f"Unknown allergen '{tag}'. Available: {', '.join(ALLERGEN_BITS)}")
+            bits |= ALLERGEN_BITS[tag]
+        return (self.allergens & np.uint16(bits)) == 0
+
+    def top_foods(self, nutrient: str, n=10, allergens: Iterable[str] = (),
+                  vegetarian=False, ascending=False, meal_only=True) -> List[Tuple[str, float]]:
+        """Top foods by a nutrient per 100 g, excluding foods with any listed allergen"""
+        values = np.asarray(self.values[:, self.column(nutrient)])
+        keep = self.exclusion_mask(allergens, vegetarian) & ~np.isnan(values)
+        if meal_only:
+            keep &= self.meal
+
+        rows = np.flatnonzero(keep)
+        if rows.size == 0:
+            return []
+
+        scores = values[rows] if ascending else -values[rows]
+        n = min(n, rows.size)
+        best = np.argpartition(scores, n - 1)[:n]
+        best = best[np.argsort(scores[best], kind="stable")]
+        return [(self.foods[rows[i]], round(float(values[rows[i]]), 4)) for i in best]
+
+    def facts(self, nutrients: Iterable[str], n=5, allergens: Iterable[str] = (),
+              vegetarian=False) -> str:
+        """Plain-text nutrient facts block to insert into an LLM prompt"""
+        lines = []
+        for nutrient in nutrients:
+            top = self.top_foods(nutrient, n=n, allergens=allergens, vegetarian=vegetarian)
+            if not top:
+                continue
+            unit = self.units[nutrient]
+            foods = "; ".join(f"{name} ({value:g} {unit})" for name, value in top)
+            lines.append(f"Highest {nutrient.replace('_', ' ')} per 100 g: {foods}")
+        return "\n".join(lines)
+
+
+def load_nutrient_store(persist_path="./nutrient_store") -> Optional[NutrientStore]:
+    """Load the nutrient store if it has been built, otherwise None"""
+    version = nutrient_store_version(persist_path)
+    if version is None:
+        return None
+    return NutrientStore(persist_path, version)
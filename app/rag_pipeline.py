@@ -1,8 +1,9 @@
 from langchain_community.vectorstores import Chroma
 from langchain.embeddings import HuggingFaceEmbeddings
 from langchain_groq import ChatGroq
-from langchain.chains import RetrievalQA
+from langchain.chains.question_answering import load_qa_chain
 from app.selenium_scraper import NutritionWebScraper
+from app.semantic_cache import SemanticRetrievalCache, SemanticCachedRetriever
 from app.utils import split_text
 import os
 
@@ -16,6 +17,28 @@ WEBSITES = {
     "harvard_nutrition": "https://nutritionsource.hsph.harvard.edu/"
 }
 
+# Semantic retrieval cache shared by the loaded RAG chain
+retrieval_cache = None
+
+def make_retrieval_cache():
+    """Semantic retrieval cache configured from the environment"""
+    return SemanticRetrievalCache(
+        max_size=int(os.getenv("RETRIEVAL_CACHE_SIZE", "256")),
+        threshold=float(os.getenv("RETRIEVAL_CACHE_THRESHOLD", "0.95"))
+    )
+
+class RAGChain:
+    def __init__(self, retriever, qa_chain):
+        """Retriever plus a "stuff" QA chain, retrieving on a separate query if given"""
+        self.retriever = retriever
+        self.qa_chain = qa_chain
+
+    def invoke(self, question, retrieval_query=None):
+        """Answer the question using documents retrieved for retrieval_query"""
+        docs = self.retriever.invoke(retrieval_query or question)
+        result = self.qa_chain.invoke({"input_documents": docs, "question": question})
+        return {"result": result["output_text"], "source_documents": docs}
+
 def build_vectorstore(persist_path="./chroma_store"):
     """Build vector store using Selenium scraper"""
     
@@ -50,6 +73,8 @@ def build_vectorstore(persist_path="./chroma_store"):
 
 def load_rag_chain(persist_path="./chroma_store"):
     """Load the RAG chain with vector store and LLM"""
+    global retrieval_cache
+    
     # Check if vector store exists, if not build it
     if not os.path.exists(persist_path):
         build_vectorstore(persist_path)
@@ -71,17 +96,19 @@ def load_rag_chain(persist_path="./chroma_store"):
         model_name="llama3-8b-8192"
     )
     
+    # Paraphrased conditions ("T2D", "diabetes type II") reuse cached search results
+    retrieval_cache = make_retrieval_cache()
+    
     # Create the RAG chain with improved configuration
-    rag_chain = RetrievalQA.from_chain_type(
-        llm=llm,
-        chain_type="stuff",
-        retriever=vectordb.as_retriever(
-            search_type="similarity",
-            search_kwargs={
-                "k": 10  # Retrieve more documents for better coverage
-            }
+    rag_chain = RAGChain(
+        retriever=SemanticCachedRetriever(
+            vectorstore=vectordb,
+            embedding=embedding,
+            cache=retrieval_cache,
+            persist_path=persist_path,
+            k=10  # Retrieve more documents for better coverage
         ),
-        return_source_documents=True
+        qa_chain=load_qa_chain(llm, chain_type="stuff")
     )
     
     return rag_chain
@@ -1,8 +1,14 @@
 from fastapi import APIRouter, HTTPException
+import logging
 from pydantic import BaseModel
+from app import rag_pipeline
 from app.rag_pipeline import load_rag_chain
+from app.nutrient_store import (
+    load_nutrient_store, nutrient_store_version, parse_allergens, unmapped_allergies, nutrients_for_conditions
+)
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 # Lazy load the RAG chain
 rag_chain = None
@@ -16,6 +22,24 @@ def get_rag_chain():
             raise HTTPException(status_code=500, detail=f"Failed to load RAG chain: {str(e)}")
     return rag_chain
 
+# Lazy load the nutrient store (optional, built by run_build.py from FDC data)
+nutrient_store = None
+nutrient_store_loaded_version = None
+
+def get_nutrient_store():
+    global nutrient_store, nutrient_store_loaded_version
+    version = nutrient_store_version()
+    if version != nutrient_store_loaded_version:
+        # (Re)load on first use and whenever run_build.py swaps in a new version;
+        # a broken store is logged once and not retried until the next rebuild
+        nutrient_store_loaded_version = version
+        nutrient_store = None
+        try:
+            nutrient_store = load_nutrient_store()
+        except Exception:
+            logger.exception("Failed to load nutrient store, nutrient facts disabled")
+    return nutrient_store
+
 class GetRecommendationsRequest(BaseModel):
     health_conditions: str
     allergies: str
@@ -41,7 +65,24 @@ def get_recommendations(data: GetRecommendationsRequest):
         
         context = ", ".join(prompt_parts) if prompt_parts else "general health"
         
+        # Exact nutrient numbers from the FDC store, filtered by the user's allergies.
+        # Skipped when any listed allergy can't be mapped to a tag, since it couldn't be filtered.
+        nutrient_facts = ""
+        store = get_nutrient_store()
+        if store is not None and not unmapped_allergies(data.allergies):
+            facts = store.facts(
+                nutrients_for_conditions(data.health_conditions),
+                allergens=parse_allergens(data.allergies),
+                vegetarian=data.is_vegetarian
+            )
+            if facts:
+                nutrient_facts = (
+                    f"NUTRIENT FACTS (USDA FoodData Central, per 100 g):\n{facts}\n"
+                    f"Prefer these foods where suitable and quote their exact nutrient values.\n\n"
+                )
+        
         prompt = (
+            f"{nutrient_facts}"
             f"Create a personalized diet recommendation for someone with {context}. "
             f"Please structure your response EXACTLY in the following format:\n\n"
             f"DIETARY RECOMMENDATIONS:\n"
@@ -63,7 +104,10 @@ def get_recommendations(data: GetRecommendationsRequest):
             f"For the HEALTH ADVICE section, use proper markdown formatting with - for bullet points and focus on evidence-based recommendations for managing and improving the specific health condition mentioned."
         )
 
-        result = chain.invoke({"query": prompt})
+        # Retrieve on the profile (conditions, allergies, diet): everything user-specific
+        # in the prompt, without the fixed template text that would make every profile
+        # look alike to the semantic retrieval cache
+        result = chain.invoke(prompt, retrieval_query=context)
         response_text = result["result"]
         
         # Parse the response into structured sections
@@ -207,3 +251,12 @@ def get_recommendations(data: GetRecommendationsRequest):
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating recommendation: {str(e)}")
+
+@router.get("/retrieval_cache_stats")
+def retrieval_cache_stats():
+    """Hit-rate metrics for the semantic retrieval cache"""
+    cache = rag_pipeline.retrieval_cache
+    if cache is None:
+        # Chain not loaded yet: report an empty cache with the configured limits
+        cache = rag_pipeline.make_retrieval_cache()
+    return cache.stats()
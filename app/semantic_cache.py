@@ -0,0 +1,149 @@
+import numpy as np
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, List, Optional
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+
+
+class SemanticRetrievalCache:
+    def __init__(self, max_size=256, threshold=0.95):
+        """LRU cache of retrieved documents keyed by query embedding similarity.
+
+        A max_size of 0 or less disables caching; every lookup is a miss.
+        """
+        self.max_size = max(max_size, 0)
+        self.threshold = threshold
+        self.lock = threading.Lock()
+        # Vector store version the cached entries were retrieved from
+        self.version = None
+        # Counters run for the cache's lifetime, across invalidations
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        with self.lock:
+            self._reset()
+
+    def _reset(self):
+        # One row per slot, unit-normalised so a dot product is cosine similarity
+        self.embeddings = None
+        self.valid = np.zeros(self.max_size, dtype=bool)
+        # slot -> documents, ordered from least to most recently used
+        self.entries = OrderedDict()
+
+    def validate(self, version):
+        """Clear the cache if the vector store version has changed.
+
+        This is the only invalidation mechanism: rebuilding the store (even from
+        another process, e.g. run_build.py) changes its version.
+        """
+        with self.lock:
+            if version == self.version:
+                return
+            if self.entries:
+                self.invalidations += 1
+            self._reset()
+            self.version = version
+
+    def lookup(self, embedding: np.ndarray) -> Optional[List[Document]]:
+        """Cached documents for the most similar previous query above the threshold"""
+        with self.lock:
+            if self.embeddings is None or not self.entries:
+                self.misses += 1
+                return None
+
+            scores = self.embeddings @ embedding
+            scores[~self.valid] = -np.inf
+            slot = int(np.argmax(scores))
+            if scores[slot] < self.threshold:
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(slot)
+            self.hits += 1
+            return self.entries[slot]
+
+    def add(self, embedding: np.ndarray, docs: List[Document], version):
+        """Store documents retrieved for a query embedding, evicting the LRU entry if full.
+
+        Results from a store version other than the current one are dropped, so a
+        search that raced with a rebuild cannot repopulate the cache with stale documents.
+        """
+        with self.lock:
+            if self.max_size == 0 or version != self.version:
+                return
+
+            if self.embeddings is None:
+                self.embeddings = np.zeros((self.max_size, embedding.shape[0]), dtype=np.float32)
+
+            if len(self.entries) < self.max_size:
+                slot = int(np.argmin(self.valid))
+            else:
+                slot, _ = self.entries.popitem(last=False)
+                self.evictions += 1
+
+            self.embeddings[slot] = embedding
+            self.valid[slot] = True
+            self.entries[slot] = docs
+
+    def stats(self) -> dict:
+        """Hit-rate metrics for monitoring"""
+        with self.lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self.entries),
+                "max_size": self.max_size,
+                "threshold": self.threshold,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+def store_version(persist_path: str):
+    """Fingerprint of the persisted vector store, changes when it is rebuilt.
+
+    Compared for equality only: a store restored with its original (older)
+    mtime, e.g. by `cp -p` or `rsync -a`, still has a different inode or size.
+    """
+    try:
+        stat = os.stat(os.path.join(persist_path, "chroma.sqlite3"))
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+class SemanticCachedRetriever(BaseRetriever):
+    """Retriever that embeds the query once and reuses results for similar queries"""
+
+    vectorstore: Any
+    embedding: Any
+    cache: Any
+    persist_path: str
+    k: int = 10
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        # Record the version before searching; add() discards results if it changes meanwhile
+        version = store_version(self.persist_path)
+        self.cache.validate(version)
+
+        query_embedding = np.asarray(self.embedding.embed_query(query), dtype=np.float32)
+        norm = np.linalg.norm(query_embedding)
+        if norm:
+            query_embedding /= norm
+
+        docs = self.cache.lookup(query_embedding)
+        if docs is not None:
+            return docs
+
+        # Reuse the embedding instead of letting Chroma embed the query again
+        docs = self.vectorstore.similarity_search_by_vector(query_embedding.tolist(), k=self.k)
+        self.cache.add(query_embedding, docs, version)
+        return docs
@@ -1,4 +1,11 @@
 # run_build.py
+import os
 from app.rag_pipeline import build_vectorstore
+from app.nutrient_store import build_nutrient_store
 
 build_vectorstore()
+
+# Optional: FDC JSON files or CSV export directories, separated by os.pathsep
+fdc_sources = os.getenv("FDC_DATA_PATH")
+if fdc_sources:
+    build_nutrient_store(fdc_sources.split(os.pathsep))
@@ -0,0 +1,50 @@
+# run_cache_calibration.py
+# Prints cosine similarities between retrieval queries to choose RETRIEVAL_CACHE_THRESHOLD.
+# Paraphrases should score above the threshold, near-miss conditions below it.
+import numpy as np
+from app.rag_pipeline import embedding
+
+PARAPHRASES = [
+    ("type 2 diabetes", "diabetes type II"),
+    ("type 2 diabetes", "T2D, diabetic"),
+    ("high blood pressure", "hypertension"),
+    ("high cholesterol", "hypercholesterolemia"),
+    ("iron deficiency anemia", "anaemia from low iron"),
+    ("heart disease", "cardiovascular disease"),
+]
+
+NEAR_MISSES = [
+    ("type 2 diabetes", "type 1 diabetes"),
+    ("hypertension", "hypotension"),
+    ("hyperthyroidism", "hypothyroidism"),
+    ("celiac disease", "crohn's disease"),
+    ("kidney stones", "gallstones"),
+]
+
+
+def query(conditions):
+    # Same shape as the retrieval query built in routes.get_recommendations
+    return f"health conditions: {conditions}"
+
+
+def similarity(a, b):
+    vectors = np.asarray(embedding.embed_documents([query(a), query(b)]))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return float(vectors[0] @ vectors[1])
+
+
+positive = [(a, b, similarity(a, b)) for a, b in PARAPHRASES]
+negative = [(a, b, similarity(a, b)) for a, b in NEAR_MISSES]
+
+for label, pairs in (("paraphrases", positive), ("near misses", negative)):
+    print(f"{label}:")
+    for a, b, score in pairs:
+        print(f"  {score:.3f}  {a!r} vs {b!r}")
+
+lowest_paraphrase = min(score for _, _, score in positive)
+highest_near_miss = max(score for _, _, score in negative)
+if highest_near_miss < lowest_paraphrase:
+    print(f"Any threshold in ({highest_near_miss:.3f}, {lowest_paraphrase:.3f}] separates these pairs")
+else:
+    print(f"No threshold separates these pairs; stay above {highest_near_miss:.3f} "
+          f"to avoid near-miss hits (paraphrases scoring below it will miss)")
@@ -0,0 +1,168 @@
+import json
+import os
+
+import pytest
+
+from app.nutrient_store import (
+    ALLERGEN_BITS, allergen_mask, build_nutrient_store, load_nutrient_store, nutrient_store_version,
+    nutrients_for_conditions, parse_allergens, unmapped_allergies
+)
+
+
+def tags(name, category=""):
+    mask = allergen_mask(name, category)
+    return {tag for tag, bit in ALLERGEN_BITS.items() if mask & bit}
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("Cheesecake", {"milk", "wheat"}),
+    ("Eggnog", {"egg", "milk"}),
+    ("Cornbread", {"wheat"}),
+    ("Flatbread", {"wheat"}),
+    ("Waffles, plain", {"wheat"}),
+    ("Meatballs, frozen", {"meat"}),
+    ("Hamburger, single patty", {"meat"}),
+    ("Pepperoni pizza", {"meat", "milk", "wheat"}),
+    ("Salami, Italian", {"meat"}),
+    ("Bison, ground", {"meat"}),
+    ("Catfish fillets", {"fish"}),
+    ("Buttermilk pancakes", {"milk", "wheat"}),
+    ("Spaghetti, cooked", {"wheat"}),
+    ("Cereals ready-to-eat, ALL-BRAN", {"wheat"}),
+    ("Mollusks, squid", {"shellfish"}),
+])
+def test_allergen_mask_tags_compound_names(name, expected):
+    assert expected <= tags(name)
+
+
+@pytest.mark.parametrize("name", [
+    "Eggplant, raw", "Collards, cooked", "Nutmeg, ground", "Squash, butternut", "Chickpeas, canned",
+    "Almond milk, unsweetened",
+])
+def test_allergen_mask_ignores_look_alikes(name):
+    assert not tags(name) & {"egg", "meat", "peanut", "milk"}
+
+
+@pytest.mark.parametrize("category, expected", [
+    ("Dairy and Egg Products", {"milk", "egg"}),
+    ("Beef Products", {"meat"}),
+    ("Pork Products", {"meat"}),
+    ("Sausages and Luncheon Meats", {"meat"}),
+    ("Poultry Products", {"meat"}),
+    ("Finfish and Shellfish Products", {"fish", "shellfish"}),
+    ("Baked Products", {"wheat"}),
+    ("Cereal Grains and Pasta", {"wheat"}),
+])
+def test_allergen_mask_tags_fdc_categories(category, expected):
+    assert tags("Unlisted food", category) == expected
+
+
+def test_allergies_map_per_item():
+    assert set(parse_allergens("nut allergy")) == {"peanut", "tree_nut"}
+    assert set(parse_allergens("seafood")) == {"fish", "shellfish"}
+    assert unmapped_allergies("peanuts, mustard") == ["mustard"]
+    assert unmapped_allergies("peanuts and dairy") == []
+    assert unmapped_allergies("none") == []
+    assert unmapped_allergies("n/a") == []
+
+
+def test_nutrients_for_conditions():
+    assert nutrients_for_conditions("") == ["fiber", "protein"]
+    assert nutrients_for_conditions("chronic kidney disease") == []
+    assert nutrients_for_conditions("type 2 diabetes, kidney disease") == []
+    assert nutrients_for_conditions("heartburn") == []
+    assert nutrients_for_conditions("heart disease, T2D") == ["fiber", "potassium", "protein"]
+
+
+def write_json(path, foods):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"foods": foods}, f)
+    return str(path)
+
+
+def food(fdc_id, name, fiber, **extra):
+    record = {"description": name, "foodNutrients": [{"nutrientId": 1079, "value": fiber}], **extra}
+    if fdc_id is not None:
+        record["fdcId"] = fdc_id
+    return record
+
+
+@pytest.fixture
+def store(tmp_path):
+    source = write_json(tmp_path / "fdc.json", [
+        food(1, "Lentils, raw", 10.7),
+        food(2, "Eggplant, raw", 3.0),
+        food(3, "Egg, whole, raw", 0.0),
+        food(4, "Egg, white, raw", 0.0),
+        food(5, "Spices, cinnamon, ground", 53.1, foodCategory="Spices and Herbs"),
+        food(6, "Cheesecake", 0.5),
+        food(None, "NoId A", 1.0),
+        food(None, "NoId B", 2.0),
+    ])
+    build_nutrient_store([source], str(tmp_path / "store"))
+    return load_nutrient_store(str(tmp_path / "store"))
+
+
+def test_top_foods_filters_allergens_and_non_meal_foods(store):
+    top = store.top_foods("fiber", n=3, allergens=["milk"])
+    assert top == [("Lentils, raw", 10.7), ("Eggplant, raw", 3.0), ("NoId B", 2.0)]
+
+
+def test_foods_without_fdc_id_are_kept(store):
+    assert store.find("NoId A") is not None and store.find("NoId B") is not None
+    assert store.fdc_ids[store.find("NoId A")] is None
+
+
+def test_find_uses_whole_words(store):
+    assert store.find("") is None
+    assert store.lookup("") is None
+    assert store.foods[store.find("egg")] in ("Egg, whole, raw", "Egg, white, raw")
+    assert store.foods[store.find("egg white")] == "Egg, white, raw"
+    assert store.foods[store.find("lentils")] == "Lentils, raw"
+    assert store.find("lentil") is None
+
+
+def test_rebuild_swaps_in_new_version(tmp_path, store):
+    path = str(tmp_path / "store")
+    old_version = nutrient_store_version(path)
+    build_nutrient_store([write_json(tmp_path / "new.json", [food(9, "Apples, raw", 2.4)])], path)
+
+    # The loaded store still reads its own, intact version
+    assert store.top_foods("fiber", n=1) == [("Lentils, raw", 10.7)]
+
+    assert nutrient_store_version(path) != old_version
+    assert load_nutrient_store(path).top_foods("fiber") == [("Apples, raw", 2.4)]
+    assert sorted(os.listdir(path)) == ["CURRENT", nutrient_store_version(path)]
+
+
+def test_csv_export_is_filtered_by_data_type(tmp_path):
+    export = tmp_path / "export"
+    export.mkdir()
+    (export / "food.csv").write_text(
+        "fdc_id,data_type,description,food_category_id\n"
+        "1,sr_legacy_food,\"Beans, black\",16\n"
+        "2,branded_food,CRUNCHY SNACK,\n"
+    )
+    (export / "food_category.csv").write_text("id,code,description\n16,1600,Legumes and Legume Products\n")
+    (export / "food_nutrient.csv").write_text(
+        "id,fdc_id,nutrient_id,amount\n"
+        "10,1,1079,15.5\n"
+        "11,1,1003,21.6\n"
+        "12,2,1079,9.0\n"
+        "13,1,9999,1.0\n"
+    )
+    build_nutrient_store([str(export)], str(tmp_path / "store"))
+    loaded = load_nutrient_store(str(tmp_path / "store"))
+
+    assert loaded.foods == ["Beans, black"]
+    assert loaded.lookup("beans black") == {"protein": 21.6, "fiber": 15.5}
+
+
+def test_legacy_folate_number(tmp_path):
+    source = write_json(tmp_path / "fdc.json", [{
+        "fdcId": 1, "description": "Spinach, raw",
+        "foodNutrients": [{"nutrient": {"number": "435"}, "amount": 194},
+                          {"nutrient": {"number": "417"}, "amount": 194.5}],
+    }])
+    build_nutrient_store([source], str(tmp_path / "store"))
+    assert load_nutrient_store(str(tmp_path / "store")).lookup("spinach") == {"folate": 194.5}
@@ -0,0 +1,92 @@
+import os
+import shutil
+
+import numpy as np
+from langchain_core.documents import Document
+
+from app.semantic_cache import SemanticCachedRetriever, SemanticRetrievalCache, store_version
+
+VECTORS = {
+    "type 2 diabetes": [1.0, 0.0, 0.0],
+    "diabetes type II": [0.99, 0.1, 0.0],
+    "hypertension": [0.0, 1.0, 0.0],
+    "celiac disease": [0.0, 0.0, 1.0],
+}
+
+
+class FakeEmbedding:
+    def embed_query(self, text):
+        return VECTORS[text]
+
+
+class FakeVectorStore:
+    def __init__(self):
+        self.searches = 0
+
+    def similarity_search_by_vector(self, embedding, k):
+        self.searches += 1
+        return [Document(page_content=f"{round(x, 3)}") for x in embedding][:k]
+
+
+def retriever(tmp_path, cache):
+    (tmp_path / "chroma.sqlite3").touch()
+    return SemanticCachedRetriever(
+        vectorstore=FakeVectorStore(), embedding=FakeEmbedding(), cache=cache, persist_path=str(tmp_path)
+    )
+
+
+def test_cache_toggle_leaves_results_unchanged(tmp_path):
+    queries = ["type 2 diabetes", "hypertension", "type 2 diabetes", "celiac disease", "hypertension"]
+    cached = retriever(tmp_path, SemanticRetrievalCache(max_size=8))
+    uncached = retriever(tmp_path, SemanticRetrievalCache(max_size=0))
+
+    assert [cached.invoke(q) for q in queries] == [uncached.invoke(q) for q in queries]
+    assert cached.vectorstore.searches == 3
+    assert uncached.vectorstore.searches == 5
+
+
+def test_similar_queries_hit_and_lru_evicts(tmp_path):
+    cache = SemanticRetrievalCache(max_size=2, threshold=0.95)
+    r = retriever(tmp_path, cache)
+    for q in ["type 2 diabetes", "diabetes type II", "hypertension", "celiac disease", "type 2 diabetes"]:
+        r.invoke(q)
+
+    assert r.vectorstore.searches == 4
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["evictions"] == 2
+
+
+def test_restored_store_with_older_mtime_invalidates(tmp_path):
+    cache = SemanticRetrievalCache(max_size=8)
+    r = retriever(tmp_path, cache)
+    r.invoke("hypertension")
+
+    # Simulate `cp -p` of a backup: new file, original (older) timestamps
+    path = tmp_path / "chroma.sqlite3"
+    backup = tmp_path / "backup.sqlite3"
+    backup.write_bytes(b"restored")
+    os.utime(backup, ns=(1, 1))
+    shutil.copy2(backup, path)
+
+    r.invoke("hypertension")
+    stats = cache.stats()
+    assert r.vectorstore.searches == 2
+    assert stats["invalidations"] == 1
+    assert stats["misses"] == 2
+
+
+def test_results_from_a_replaced_store_are_not_cached(tmp_path):
+    cache = SemanticRetrievalCache(max_size=8)
+    cache.validate(store_version(str(tmp_path)))
+    stale_version = ("old inode", 0, 0)
+    cache.add(np.asarray(VECTORS["hypertension"], dtype=np.float32), [], stale_version)
+    assert cache.stats()["size"] == 0
+
+
+def test_zero_size_disables_cache(tmp_path):
+    cache = SemanticRetrievalCache(max_size=0)
+    r = retriever(tmp_path, cache)
+    r.invoke("hypertension")
+    r.invoke("hypertension")
+    assert r.vectorstore.searches == 2
+    assert cache.stats()["size"] == 0